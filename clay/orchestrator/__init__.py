@@ -1,10 +1,19 @@
 """Clay Orchestrator - Bare-minimum orchestrator."""
 
-from .orchestrator import ClayOrchestrator
 from .plan import Step, Plan
 
 __all__ = [
     'ClayOrchestrator',
     'Plan',
     'Step',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # The agents only need Plan/Step; load the orchestrator (and the LLM
+    # client behind it) on first use instead of on package import.
+    if name == 'ClayOrchestrator':
+        from .orchestrator import ClayOrchestrator
+        globals()[name] = ClayOrchestrator
+        return ClayOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,29 +4,95 @@ import asyncio
 import json
 import os
 import sys
-import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
 from ..llm import completion
 from ..trace import clear_trace, save_trace_file, set_session_id, trace_operation
 from .plan import Plan
 
+# ANSI color codes for console output
+_ANSI_RED = "\033[31m"
+_ANSI_GREEN = "\033[32m"
+_ANSI_YELLOW = "\033[33m"
+_ANSI_GRAY = "\033[37m"
+_ANSI_RESET = "\033[0m"
+
+# Terminal capabilities do not change during the process lifetime, so check once
+_SUPPORTS_ANSI = bool(
+    hasattr(sys.stdout, 'isatty') and sys.stdout.isatty() and os.getenv('TERM') != 'dumb'
+)
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Encode data as compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    # Match orjson's compact output so plan files don't depend on what is installed
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_array(items: list[bytes]) -> bytes:
+    """Join encoded JSON values into an array with one value per line."""
+    if not items:
+        return b"[]"
+    return b"[\n    " + b",\n    ".join(items) + b"\n  ]"
+
+
+def _truncate(text: str, max_length: int) -> str:
+    """Shorten text to at most max_length characters, ending with an ellipsis."""
+    return text if len(text) <= max_length else text[:max_length - 3] + "..."
+
+
+def _truncate_description(description: Optional[str], max_length: int = 80) -> str:
+    """Get a single-line preview of a step description for the plan summary."""
+    description = description.strip() if description else ""
+    # Only the first line is shown so the tracked display height stays bounded
+    first_line = description.split('\n', 1)[0]
+    if len(first_line) < len(description):
+        first_line += "..."
+    return _truncate(first_line, max_length)
+
+
+def _format_bash_display(parameters: dict[str, Any]) -> str:
+    """Format the display name for a bash tool invocation."""
+    return f"Bash({_truncate(parameters.get('command', ''), 60)})"
+
+
+def _format_write_display(parameters: dict[str, Any]) -> str:
+    """Format the display name for a write tool invocation."""
+    return f"Write({parameters.get('file_path', '')})"
+
+
+def _format_read_display(parameters: dict[str, Any]) -> str:
+    """Format the display name for a read tool invocation."""
+    return f"Read({parameters.get('file_path', '')})"
+
+
+# Tool name -> display formatter, built once instead of branching on every redraw
+_TOOL_DISPLAY_FORMATTERS = {
+    "bash": _format_bash_display,
+    "write": _format_write_display,
+    "read": _format_read_display,
+}
+
 
 class InteractiveConsole:
     """Simplified console display with a single print function that handles clearing."""
 
     def __init__(self):
-        self.supports_ansi = self._check_ansi_support()
+        self.supports_ansi = _SUPPORTS_ANSI
         self.tracked_lines = 0  # Lines that will be cleared on next display
 
-    def _check_ansi_support(self) -> bool:
-        """Check if terminal supports ANSI escape sequences."""
-        return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty() and os.getenv('TERM') != 'dumb'
-
     def display(self, content: str = "", track_lines: bool = True) -> None:
         """Single print function that displays content and optionally tracks lines for clearing.
 
@@ -34,56 +100,106 @@ class InteractiveConsole:
             content: Content to display (can be multi-line string)
             track_lines: If True, clears previous tracked content and tracks this content
         """
+        # Build the clear sequence and the new content as a single frame so the
+        # terminal never renders a half-cleared display
+        frame = ""
+
         # Clear previously tracked lines if we're tracking new content
         if track_lines and self.supports_ansi and self.tracked_lines > 0:
-            for _ in range(self.tracked_lines):
-                sys.stdout.write('\033[A')  # Move cursor up one line
-                sys.stdout.write('\033[K')  # Clear line
-            sys.stdout.flush()
+            # Move cursor to the start of the first tracked line and erase to end of screen
+            frame = f'\033[{self.tracked_lines}F\033[J'
             self.tracked_lines = 0
 
         # Display the content
         if content:
-            print(content)
+            frame += content + '\n'
 
             # Track lines for future clearing if requested
             if track_lines:
-                self.tracked_lines = len(content.split('\n'))
+                self.tracked_lines = content.count('\n') + 1
         elif track_lines:
             # Reset tracking if displaying empty content
             self.tracked_lines = 0
 
+        if frame:
+            sys.stdout.write(frame)
+            sys.stdout.flush()
+
+    def append(self, content: str) -> None:
+        """Append content below the tracked lines and track it as part of the same block.
+
+        Args:
+            content: Content to append (can be multi-line string)
+        """
+        sys.stdout.write(content + '\n')
+        sys.stdout.flush()
+        self.tracked_lines += content.count('\n') + 1
+
+
+def _release_waiter(waiter: asyncio.Future) -> None:
+    """Resolve a ToolOutputBuffer waiter whose timeout expired."""
+    if not waiter.done():
+        waiter.set_result(False)
+
 
 @dataclass
 class ToolOutputBuffer:
-    """Buffer for capturing and summarizing tool output in real-time."""
+    """Buffer for capturing and summarizing tool output in real-time.
+
+    Tools stream output from coroutines on the event loop, the same thread the
+    monitor reads from, so the buffer needs no locking.
+    """
+
+    # Yellow for running, green for success, red for failure
+    _STATUS_COLORS = {
+        "Running": _ANSI_YELLOW,
+        "Success": _ANSI_GREEN,
+        "Failed": _ANSI_RED,
+    }
 
     def __init__(self, tool_name: str, parameters: dict[str, Any]):
+        self.max_display_lines = 12
+        # Ring buffer keeping only the last max_display_lines for real-time display
+        self.lines = deque(maxlen=self.max_display_lines)
+        self.reset(tool_name, parameters)
+
+    def reset(self, tool_name: str, parameters: dict[str, Any]) -> None:
+        """Prepare the buffer for a new tool execution, reusing its line storage.
+
+        Args:
+            tool_name: Name of the tool being executed
+            parameters: Parameters the tool is executed with
+        """
         self.tool_name = tool_name
         self.parameters = parameters
-        self.start_time = time.time()
+        self.display_name = None  # Tool header text, formatted on first display
+        self.start_time = time.monotonic()
         self.end_time = None
-        self.lines = []
+        self.lines.clear()
         self.total_lines = 0
-        self.max_display_lines = 12
-        self._lock = threading.Lock()
         self.last_displayed_lines = 0  # Track how many lines were last displayed
         self.is_finished = False  # Track if tool execution is complete
         self.is_success = None  # Track success/failure state
+        # Set when output is added or the tool finishes; the monitor waits on _waiter
+        self._changed = False
+        self._waiter = None
 
     def add_output(self, text: str) -> None:
         """Add output text to the buffer."""
         if not text:
             return
 
-        with self._lock:
+        # Streaming tools hand over one line at a time; a printable line without
+        # its trailing newline contains no line breaks and can skip splitlines()
+        line = text[:-1] if text.endswith('\n') else text
+        if line.isprintable():
+            self.lines.append(line)
+            self.total_lines += 1
+        else:
             new_lines = text.splitlines()
             self.lines.extend(new_lines)
             self.total_lines += len(new_lines)
-
-            # Keep only the last max_display_lines for real-time display
-            if len(self.lines) > self.max_display_lines:
-                self.lines = self.lines[-self.max_display_lines:]
+        self._notify_change()
 
     def finish(self, success: bool = True) -> None:
         """Mark the tool execution as finished.
@@ -91,14 +207,60 @@ class ToolOutputBuffer:
         Args:
             success: Whether the tool execution was successful
         """
-        with self._lock:
-            self.end_time = time.time()
-            self.is_finished = True
-            self.is_success = success
+        self.end_time = time.monotonic()
+        self.is_finished = True
+        self.is_success = success
+        self._notify_change()
+
+    def _notify_change(self) -> None:
+        """Wake up the monitor waiting in wait_for_change."""
+        self._changed = True
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(True)
+
+    async def wait_for_change(self, timeout: float) -> bool:
+        """Wait until output is added or the tool finishes.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the buffer changed, False if the timeout expired
+        """
+        if not self._changed:
+            # A bare future with a timer rather than asyncio.wait_for(), which can
+            # swallow a cancellation that arrives together with the wake-up
+            loop = asyncio.get_running_loop()
+            waiter = self._waiter = loop.create_future()
+            timer = loop.call_later(timeout, _release_waiter, waiter)
+            try:
+                if not await waiter:
+                    return False
+            finally:
+                timer.cancel()
+                self._waiter = None
+        self._changed = False
+        return True
+
+    def _get_colors(self, status: str, use_colors: bool) -> tuple[str, str, str]:
+        """Get (status_color, reset_color, output_color) for a status."""
+        if not use_colors:
+            return "", "", ""
+        return self._STATUS_COLORS[status], _ANSI_RESET, _ANSI_GRAY
+
+    def _format_summary(
+        self, header: str, output_lines: tuple[str, ...], gray_color: str, reset_color: str
+    ) -> str:
+        """Join the summary header and the indented output block into one string."""
+        # Indentation is part of the separator, so the block is built by a single join.
+        # The whole block is gray; the terminal keeps the color until reset.
+        output = "\n     ".join(output_lines)
+        return f"{header}\n{gray_color}     {output}{reset_color}"
 
     def get_execution_time(self) -> float:
         """Get execution time in seconds."""
-        end_time = self.end_time if self.end_time else time.time()
+        end_time = self.end_time if self.end_time else time.monotonic()
         return end_time - self.start_time
 
     def get_real_time_summary(self, use_colors: bool = True) -> tuple[str, int]:
@@ -110,61 +272,80 @@ class ToolOutputBuffer:
         Returns:
             tuple[str, int]: (summary_text, lines_count_in_summary)
         """
-        with self._lock:
-            execution_time = self.get_execution_time()
-
-            summary_parts = []
-
-            # Determine status and colors
-            if not self.is_finished:
-                status = "Running"
-                status_color = "\033[33m" if use_colors else ""  # Yellow for running
-            elif self.is_success:
-                status = "Success"
-                status_color = "\033[32m" if use_colors else ""  # Green for success
-            else:
-                status = "Failed"
-                status_color = "\033[31m" if use_colors else ""  # Red for failure
+        execution_time = self.get_execution_time()
+        total_lines = self.total_lines
+        lines = tuple(self.lines)
+
+        # Determine status and colors
+        if not self.is_finished:
+            status = "Running"
+        elif self.is_success:
+            status = "Success"
+        else:
+            status = "Failed"
+        status_color, reset_color, gray_color = self._get_colors(status, use_colors)
 
-            reset_color = "\033[0m" if use_colors else ""
-            gray_color = "\033[37m" if use_colors else ""  # Gray for output text
+        # Header with tool info and stats
+        header = (
+            f"  ⎿ {status_color}{status}{reset_color} "
+            f"({total_lines} lines, {execution_time:.1f}s)"
+        )
 
-            # Header with tool info and stats
-            summary_parts.append(
-                f"  ⎿ {status_color}{status}{reset_color} "
-                f"({self.total_lines} lines, {execution_time:.1f}s)"
-            )
+        # Show last lines (up to max_display_lines)
+        output_lines = lines
+        if not lines:
+            output_lines = ("(no output yet)",)
+        elif total_lines > len(lines):
+            # If there are more lines than displayed, show indicator
+            hidden_lines = total_lines - len(lines)
+            output_lines += (f"... (+{hidden_lines} earlier lines)",)
 
-            # Show last lines (up to max_display_lines) in gray
-            if self.lines:
-                display_lines = self.lines[-self.max_display_lines:]
-                for line in display_lines:
-                    summary_parts.append(f"     {gray_color}{line}{reset_color}")
-
-                # If there are more lines than displayed, show indicator
-                if self.total_lines > len(self.lines):
-                    hidden_lines = self.total_lines - len(self.lines)
-                    summary_parts.append(
-                        f"     {gray_color}... (+{hidden_lines} earlier lines){reset_color}"
-                    )
-                    lines_in_summary = len(summary_parts)
-                else:
-                    lines_in_summary = len(summary_parts)
-            else:
-                summary_parts.append(f"     {gray_color}(no output yet){reset_color}")
-                lines_in_summary = len(summary_parts)
+        summary = self._format_summary(header, output_lines, gray_color, reset_color)
+        return summary, len(output_lines) + 1
 
-            return "\n".join(summary_parts), lines_in_summary
+    def snapshot(self, use_colors: bool = True) -> tuple[str, int]:
+        """Get the real-time summary and mark its output as displayed in one step.
+
+        Args:
+            use_colors: Whether to use ANSI color codes
+
+        Returns:
+            tuple[str, int]: (summary_text, lines_count_in_summary)
+        """
+        self.last_displayed_lines = self.total_lines
+        return self.get_real_time_summary(use_colors)
+
+    def get_incremental(self, since_total: int, use_colors: bool = True) -> Optional[str]:
+        """Get output lines added since a previous real-time summary.
+
+        Args:
+            since_total: Value of total_lines when the previous summary was displayed
+            use_colors: Whether to use ANSI color codes
+
+        Returns:
+            The new lines formatted like the summary's output block, or None if
+            they cannot simply be appended below the previous summary
+        """
+        total_lines = self.total_lines
+        # The previous summary must have shown real output without the hidden
+        # lines indicator, and the new lines must still fit in the window
+        if since_total == 0 or since_total >= total_lines:
+            return None
+        if total_lines > self.max_display_lines:
+            return None
+        new_lines = tuple(self.lines)[since_total:]
+
+        _, reset_color, gray_color = self._get_colors("Running", use_colors)
+        output = "\n     ".join(new_lines)
+        return f"{gray_color}     {output}{reset_color}"
 
     def has_new_output(self) -> bool:
         """Check if there's new output since last display."""
-        with self._lock:
-            return self.total_lines > self.last_displayed_lines or self.is_finished
+        return self.total_lines > self.last_displayed_lines or self.is_finished
 
     def mark_displayed(self) -> None:
         """Mark current output as displayed."""
-        with self._lock:
-            self.last_displayed_lines = self.total_lines
+        self.last_displayed_lines = self.total_lines
 
     def get_final_summary(self, use_colors: bool = True) -> str:
         """Get final summary for completed tool execution.
@@ -172,45 +353,29 @@ class ToolOutputBuffer:
         Args:
             use_colors: Whether to use ANSI color codes
         """
-        with self._lock:
-            execution_time = self.get_execution_time()
+        execution_time = self.get_execution_time()
+        total_lines = self.total_lines
+        lines = tuple(self.lines)
 
-            # Determine colors based on success/failure
-            if self.is_success:
-                status = "Success"
-                status_color = "\033[32m" if use_colors else ""  # Green
-            else:
-                status = "Failed"
-                status_color = "\033[31m" if use_colors else ""  # Red
-
-            reset_color = "\033[0m" if use_colors else ""
-            gray_color = "\033[37m" if use_colors else ""  # Gray for output
-
-            if self.total_lines == 0:
-                return f"  ⎿ {status_color}{status}{reset_color} (no output, {execution_time:.1f}s)"
-            elif self.total_lines <= self.max_display_lines:
-                # Show all lines if not too many
-                summary_parts = [
-                    f"  ⎿ {status_color}{status}{reset_color} "
-                    f"({self.total_lines} lines, {execution_time:.1f}s)"
-                ]
-                for line in self.lines:
-                    summary_parts.append(f"     {gray_color}{line}{reset_color}")
-                return "\n".join(summary_parts)
-            else:
-                # Show last 20 lines with summary
-                summary_parts = [
-                    f"  ⎿ {status_color}{status}{reset_color} "
-                    f"({self.total_lines} lines, {execution_time:.1f}s)"
-                ]
-                if self.total_lines > self.max_display_lines:
-                    hidden_count = self.total_lines - self.max_display_lines
-                    summary_parts.append(
-                        f"     {gray_color}... (+{hidden_count} earlier lines){reset_color}"
-                    )
-                for line in self.lines[-self.max_display_lines:]:
-                    summary_parts.append(f"     {gray_color}{line}{reset_color}")
-                return "\n".join(summary_parts)
+        # Determine colors based on success/failure
+        status = "Success" if self.is_success else "Failed"
+        status_color, reset_color, gray_color = self._get_colors(status, use_colors)
+
+        if total_lines == 0:
+            return f"  ⎿ {status_color}{status}{reset_color} (no output, {execution_time:.1f}s)"
+
+        header = (
+            f"  ⎿ {status_color}{status}{reset_color} "
+            f"({total_lines} lines, {execution_time:.1f}s)"
+        )
+
+        output_lines = lines
+        if total_lines > self.max_display_lines:
+            # Show last lines with a count of the hidden ones
+            hidden_count = total_lines - self.max_display_lines
+            output_lines = (f"... (+{hidden_count} earlier lines)",) + lines
+
+        return self._format_summary(header, output_lines, gray_color, reset_color)
 
 
 class ClayOrchestrator:
@@ -244,47 +409,78 @@ class ClayOrchestrator:
             'coding_agent': CodingAgent(interactive=interactive),
         }
 
+        # The agents are fixed after initialization, so the routing prompt is too
+        self._routing_system_prompt = self._build_routing_system_prompt()
+        # Agent used when the router's reply does not name a known agent
+        self._default_agent = next(iter(self.agents))
+
         # Real-time output tracking
         self._current_tool_buffer = None
-        self._output_lock = threading.Lock()
 
-        # Interactive console for display management
-        self.console = InteractiveConsole()
+        # Persistent monitor task fed with one buffer per tool execution
+        self._monitor_task = None
+        self._buffer_queue = None
 
-    @trace_operation
-    async def select_agent(self, goal: str) -> str:
-        """Use LLM to select the best agent for the task."""
-        agent_descriptions = self._build_agent_descriptions()
-        available_agent_names = list(self.agents.keys())
+        # Buffers released by the monitor, reused by later tool executions
+        self._buffer_pool = deque(maxlen=8)
 
-        available_agents_str = ', '.join(available_agent_names)
-        system_prompt = f"""You are an agent router that selects the best agent for a given task.
+        # Background write of the plan and trace files for the latest iteration
+        self._save_task = None
 
-Available agents:
-{agent_descriptions}
+        # (step, encoded step) for completed steps already written to plan files
+        self._encoded_completed_steps = []
 
-Choose the most appropriate agent for the task.
-Respond with ONLY the agent name from: {available_agents_str}.
+        # Interactive console for display management
+        self.console = InteractiveConsole()
 
-Selection criteria are automatically derived from each agent's description and capabilities."""
+        # Most recent plan summary, reused while the visible todo list is unchanged
+        self._last_plan_summary_key = None
+        self._last_plan_summary = ""
 
+    @trace_operation
+    async def select_agent(self, goal: str) -> str:
+        """Use LLM to select the best agent for the task."""
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": self._routing_system_prompt},
             {"role": "user", "content": f"Task: {goal}"}
         ]
 
         response = await completion(messages=messages, temperature=0.1)
-        selected_agent = response['choices'][0]['message']['content'].strip().lower()
+        # Normalize once; models sometimes quote the name or end it with a period
+        reply = response['choices'][0]['message']['content']
+        selected_agent = reply.strip().lower().strip('.,`"\'')
 
         # Validate and default to first available agent if unclear
         if selected_agent not in self.agents:
             # Default to first available agent for ambiguous cases
-            selected_agent = list(self.agents.keys())[0]
+            selected_agent = self._default_agent
 
         return selected_agent
 
-    def _save_plan_to_trace_dir(self, plan: Plan, iteration: int) -> Path:
-        """Save the plan to the traces directory for debugging."""
+    def _encode_plan(self, plan: Plan) -> bytes:
+        """Encode the plan as JSON, one step per line.
+
+        Completed steps never change, so their encoding is kept between saves
+        and only steps completed since the previous save are encoded. The
+        cache is trimmed where the completed history stops matching, e.g.
+        when a new plan is started.
+        """
+        encoded = self._encoded_completed_steps
+        reused = 0
+        for (step, _), completed_step in zip(encoded, plan.completed):
+            if step is not completed_step:
+                break
+            reused += 1
+        del encoded[reused:]
+        for step in plan.completed[reused:]:
+            encoded.append((step, _json_bytes(step.to_dict())))
+
+        completed = _json_array([data for _, data in encoded])
+        todo = _json_array([_json_bytes(step.to_dict()) for step in plan.todo])
+        return b'{\n  "completed": ' + completed + b',\n  "todo": ' + todo + b'\n}\n'
+
+    def _write_plan_data(self, data: bytes, iteration: int) -> Path:
+        """Write encoded plan data to the traces directory."""
         # Always use _trace directory
         trace_dir = self.traces_dir
         trace_dir.mkdir(parents=True, exist_ok=True)
@@ -293,16 +489,53 @@ Selection criteria are automatically derived from each agent's description and c
         filename = f"plan_iter_{iteration:03d}.json"
         filepath = trace_dir / filename
 
-        # Create plan data with optimized structure for KV-cache
-        # Goal is now embedded in UserMessageTool, no need for separate goal field
-        plan_data = plan.to_dict()
-
-        # Save to file (overwrites existing)
-        with open(filepath, 'w') as f:
-            json.dump(plan_data, f, indent=2)
+        # Write to a temporary file and rename so readers never see a partial plan
+        tmp_filepath = filepath.with_suffix('.json.tmp')
+        tmp_filepath.write_bytes(data)
+        os.replace(tmp_filepath, filepath)
 
         return filepath
 
+    def _write_trace_files(self, plan_data: bytes, iteration: int) -> None:
+        """Write the plan and the execution trace to the traces directory."""
+        self._write_plan_data(plan_data, iteration)
+        save_trace_file(None, self.traces_dir)
+
+    async def _save_trace_files(self, plan: Plan, iteration: int) -> None:
+        """Save the plan and the execution trace in a worker thread.
+
+        The plan is encoded on the event loop so the next step can start
+        executing (and mutating it) while the files are being written.
+        """
+        plan_data = self._encode_plan(plan)
+
+        # Keep writes ordered; the trace file is overwritten on every save
+        await self._wait_for_trace_files()
+        self._save_task = asyncio.create_task(
+            asyncio.to_thread(self._write_trace_files, plan_data, iteration)
+        )
+
+    async def _wait_for_trace_files(self) -> None:
+        """Wait for the pending background trace file save, if any."""
+        if self._save_task is not None:
+            save_task, self._save_task = self._save_task, None
+            await save_task
+
+    def _build_routing_system_prompt(self) -> str:
+        """Build the system prompt used by select_agent to route tasks to agents."""
+        agent_descriptions = self._build_agent_descriptions()
+        available_agents_str = ', '.join(self.agents.keys())
+
+        return f"""You are an agent router that selects the best agent for a given task.
+
+Available agents:
+{agent_descriptions}
+
+Choose the most appropriate agent for the task.
+Respond with ONLY the agent name from: {available_agents_str}.
+
+Selection criteria are automatically derived from each agent's description and capabilities."""
+
     def _build_agent_descriptions(self) -> str:
         """Build a description of available agents."""
         descriptions = []
@@ -313,25 +546,12 @@ Selection criteria are automatically derived from each agent's description and c
             descriptions.append(description)
         return "\n\n".join(descriptions)
 
-    def _check_ansi_support(self) -> bool:
-        """Check if terminal supports ANSI escape sequences."""
-        return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty() and os.getenv('TERM') != 'dumb'
-
     def _get_tool_display_name(self, tool_name: str, parameters: dict[str, Any]) -> str:
         """Get formatted tool display name."""
-        if tool_name == "bash":
-            command = parameters.get('command', '')
-            if len(command) > 60:
-                command = command[:57] + "..."
-            return f"Bash({command})"
-        elif tool_name == "write":
-            file_path = parameters.get('file_path', '')
-            return f"Write({file_path})"
-        elif tool_name == "read":
-            file_path = parameters.get('file_path', '')
-            return f"Read({file_path})"
-        else:
+        formatter = _TOOL_DISPLAY_FORMATTERS.get(tool_name)
+        if formatter is None:
             return f"{tool_name.title()}(...)"
+        return formatter(parameters)
 
     def create_plan_from_goal(self, goal: str) -> Plan:
         """Create an initial plan from a goal with a UserMessageTool step.
@@ -364,22 +584,32 @@ Selection criteria are automatically derived from each agent's description and c
 
     def _get_plan_summary_content(self, plan: Plan, interactive: bool = False) -> str:
         """Get plan summary content as a string for display."""
+        # Show up to 10 upcoming tasks (including current)
+        max_tasks_to_show = 10
+
+        # Reuse the previous summary when the visible part of the plan is unchanged
+        summary_key = (
+            len(plan.todo),
+            tuple(step.description for step in plan.todo[:max_tasks_to_show]),
+            interactive,
+        )
+        if summary_key == self._last_plan_summary_key:
+            return self._last_plan_summary
+
         if not plan.todo:
             content = "📋 ✅ All tasks completed!"
         else:
             lines = []
             lines.append("")  # Separator
 
-            current_task = plan.todo[0].description
+            current_task = _truncate_description(plan.todo[0].description)
             lines.append(f"📋 [{len(plan.todo)} remaining] Current: {current_task}")
 
-            # Show up to 10 upcoming tasks (including current)
-            max_tasks_to_show = 10
             tasks_to_show = min(len(plan.todo), max_tasks_to_show)
 
             for i in range(1, tasks_to_show):
                 if i < len(plan.todo):
-                    task = plan.todo[i].description
+                    task = _truncate_description(plan.todo[i].description)
                     lines.append(f"   {i}. {task}")
 
             # Add truncation notice if more than max_tasks_to_show items
@@ -394,20 +624,31 @@ Selection criteria are automatically derived from each agent's description and c
 
             content = "\n".join(lines)
 
+        self._last_plan_summary_key = summary_key
+        self._last_plan_summary = content
         return content
 
-    def _get_tool_output_content(self, buffer: 'ToolOutputBuffer', blink_state: bool = True) -> str:
-        """Get tool output content as a string for display."""
+    def _get_tool_output_content(
+        self, buffer: 'ToolOutputBuffer', blink_state: bool = True, summary: Optional[str] = None
+    ) -> str:
+        """Get tool output content as a string for display.
+
+        Args:
+            buffer: Buffer of the running tool
+            blink_state: Whether the blinking indicator is lit
+            summary: Pre-computed real-time summary, fetched from the buffer if omitted
+        """
         lines = []
 
         # Tool header with blinking indicator (only blink if ANSI supported)
-        tool_display = self._get_tool_display_name(buffer.tool_name, buffer.parameters)
+        # The header never changes during a tool's execution, so format it once
+        if buffer.display_name is None:
+            buffer.display_name = self._get_tool_display_name(buffer.tool_name, buffer.parameters)
+        tool_display = buffer.display_name
 
         if self.console.supports_ansi:
-            yellow = "\033[33m"
-            reset = "\033[0m"
             if blink_state:
-                lines.append(f"{yellow}⏺{reset} {tool_display}")
+                lines.append(f"{_ANSI_YELLOW}⏺{_ANSI_RESET} {tool_display}")
             else:
                 lines.append(f"  {tool_display}")
         else:
@@ -415,7 +656,8 @@ Selection criteria are automatically derived from each agent's description and c
             lines.append(f"⏺ {tool_display}")
 
         # Tool output with timer
-        summary, _ = buffer.get_real_time_summary(use_colors=self.console.supports_ansi)
+        if summary is None:
+            summary, _ = buffer.get_real_time_summary(use_colors=self.console.supports_ansi)
         lines.append(summary)
 
         return "\n".join(lines)
@@ -431,10 +673,10 @@ Selection criteria are automatically derived from each agent's description and c
         if self.console.supports_ansi:
             if buffer.is_success:
                 # Green checkmark for success
-                indicator = "\033[32m✓\033[0m"
+                indicator = f"{_ANSI_GREEN}✓{_ANSI_RESET}"
             else:
                 # Red X for failure
-                indicator = "\033[31m✗\033[0m"
+                indicator = f"{_ANSI_RED}✗{_ANSI_RESET}"
             # Replace the default indicator with colored one
             if tool_display.startswith("⏺"):
                 tool_display = indicator + tool_display[1:]
@@ -461,29 +703,77 @@ Selection criteria are automatically derived from each agent's description and c
             self.console.display(incomplete_msg, track_lines=False)
 
 
+    def _start_monitor(self, buffer: ToolOutputBuffer) -> None:
+        """Hand a buffer to the persistent monitor task, starting the task on first use."""
+        if self._monitor_task is None or self._monitor_task.done():
+            self._buffer_queue = asyncio.Queue()
+            self._monitor_task = asyncio.create_task(self._monitor_loop())
+        self._buffer_queue.put_nowait(buffer)
+
+    async def _stop_monitor(self) -> None:
+        """Cancel the persistent monitor task if it is running."""
+        if self._monitor_task is None:
+            return
+
+        self._monitor_task.cancel()
+        try:
+            await self._monitor_task
+        except asyncio.CancelledError:
+            pass
+        self._monitor_task = None
+        self._buffer_queue = None
+
+    async def _monitor_loop(self) -> None:
+        """Monitor successive tool output buffers until cancelled."""
+        while True:
+            buffer = await self._buffer_queue.get()
+            await self._monitor_tool_output(buffer)
+
+            # The executor is done with a buffer by the time it is finished, so it
+            # can be reused for a later tool execution
+            self._buffer_pool.append(buffer)
+
     async def _monitor_tool_output(self, buffer: ToolOutputBuffer) -> None:
         """Monitor tool output buffer and display real-time updates for tool execution only."""
+        loop = asyncio.get_running_loop()
         iteration = 0
+        last_redraw = loop.time()
 
         while not buffer.is_finished:
             try:
-                await asyncio.sleep(0.5)  # Check every 500ms
+                # Wake up on new output, or when the once-per-second redraw is due
+                timeout = max(0.0, 1.0 - (loop.time() - last_redraw))
+                changed = await buffer.wait_for_change(timeout)
+                if buffer.is_finished:
+                    # The executor clears the live display once the tool finishes
+                    break
+
+                if changed and loop.time() - last_redraw < 1.0:
+                    # Let a burst of lines coalesce, then append only the lines
+                    # that arrived since the last frame instead of repainting
+                    await asyncio.sleep(0.05)
+                    increment = buffer.get_incremental(buffer.last_displayed_lines)
+                    if increment and not buffer.is_finished:
+                        self.console.append(increment)
+                        buffer.mark_displayed()
+                    continue
+
+                # Full redraws refresh the timer and advance the blink indicator
+                last_redraw = loop.time()
                 iteration += 1
-                blink_state = iteration % 2 == 0  # Toggle every iteration
+                blink_state = iteration % 2 == 0  # Toggle every full redraw
 
-                # Only update display if:
-                # 1. We support ANSI (for in-place updates)
-                # 2. OR there's new output to show
-                if self.console.supports_ansi or buffer.has_new_output():
-                    # Get tool output content and display with tracking
-                    tool_content = self._get_tool_output_content(buffer, blink_state)
-                    self.console.display(tool_content)
-                    buffer.mark_displayed()
+                # The monitor only runs on ANSI terminals, so always repaint in place
+                summary, _ = buffer.snapshot(use_colors=True)
+                tool_content = self._get_tool_output_content(buffer, blink_state, summary)
+                self.console.display(tool_content)
 
             except asyncio.CancelledError:
-                # Clear display when cancelled by displaying empty content
-                self.console.display("", track_lines=True)
-                break
+                # Clear the live display if cancelled while the tool is still running;
+                # finished buffers have already been cleared by the executor
+                if not buffer.is_finished:
+                    self.console.display("", track_lines=True)
+                raise
             except Exception:
                 # Ignore errors to avoid breaking tool execution
                 pass
@@ -502,10 +792,13 @@ Selection criteria are automatically derived from each agent's description and c
         """
 
         iteration = 0
-        while plan.todo:
-            self._save_plan_to_trace_dir(plan, iteration)
-            plan = await self._execute_next_step(plan, 'coding_agent', iteration)
-            iteration += 1
+        try:
+            while plan.todo:
+                plan = await self._execute_next_step(plan, 'coding_agent', iteration)
+                iteration += 1
+        finally:
+            await self._stop_monitor()
+            await self._wait_for_trace_files()
 
         # Print final completion status
         self._print_completion_status(plan)
@@ -593,6 +886,9 @@ Selection criteria are automatically derived from each agent's description and c
                     iteration += 1
 
             finally:
+                await self._stop_monitor()
+                await self._wait_for_trace_files()
+
                 # Clean up input handler
                 should_exit = True
                 input_task.cancel()
@@ -620,9 +916,8 @@ Selection criteria are automatically derived from each agent's description and c
         agent = self.agents[agent_name]
         plan = await agent.review_plan(plan)
 
-        # Save plan at each iteration
-        self._save_plan_to_trace_dir(plan, iteration)
-        save_trace_file(None, self.traces_dir)
+        # Save plan at each iteration without delaying the next tool
+        await self._save_trace_files(plan, iteration)
 
         if len(plan.todo) == 0:
             return plan
@@ -641,14 +936,19 @@ Selection criteria are automatically derived from each agent's description and c
             return plan
 
         tool = agent.tools[tool_name]
-        monitor_task = None  # Initialize for proper cleanup
 
-        # Create output buffer for this tool execution
-        buffer = ToolOutputBuffer(tool_name, parameters)
+        # Get an output buffer for this tool execution, reusing a pooled one if possible
+        if self._buffer_pool:
+            buffer = self._buffer_pool.popleft()
+            buffer.reset(tool_name, parameters)
+        else:
+            buffer = ToolOutputBuffer(tool_name, parameters)
         self._current_tool_buffer = buffer
 
-        # Start real-time output monitoring task
-        monitor_task = asyncio.create_task(self._monitor_tool_output(buffer))
+        # Hand the buffer to the real-time output monitor. Without ANSI support the
+        # live display cannot be redrawn in place, so only the final summary is shown.
+        if self.console.supports_ansi:
+            self._start_monitor(buffer)
 
         # Create callback for real-time output
         # (bash tool will use it, others will ignore it)
@@ -675,12 +975,8 @@ Selection criteria are automatically derived from each agent's description and c
 
         buffer.finish(success=True)
 
-        # Cancel monitoring task and wait for it to complete
-        monitor_task.cancel()
-        try:
-            await monitor_task
-        except asyncio.CancelledError:
-            pass
+        # Clear the live tool display; the monitor stops drawing finished buffers
+        self.console.display("", track_lines=True)
 
         # Show final buffered summary
         self._print_tool_execution_summary(
@@ -690,6 +986,9 @@ Selection criteria are automatically derived from each agent's description and c
         # Move step to completed with successful result
         plan.complete_next_step(result=result.to_dict())
         self._current_tool_buffer = None
+        if not self.console.supports_ansi:
+            # Monitored buffers are pooled by the monitor once it lets go of them
+            self._buffer_pool.append(buffer)
 
         # Display plan summary after tool execution
         plan_content = self._get_plan_summary_content(plan, self.interactive)
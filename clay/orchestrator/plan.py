@@ -42,6 +42,10 @@ class Step:
 @dataclass
 class Plan:
     """A complete execution plan containing multiple steps."""
+    # Fixed attribute set; the fields have no class-level defaults, so plain
+    # __slots__ works on every supported Python version
+    __slots__ = ("todo", "completed")
+
     todo: List[Step]  # Steps yet to be executed
     completed: List[Step]  # Steps that have been completed
 
@@ -118,8 +122,13 @@ class Plan:
         }
 
     def to_json(self) -> str:
-        """Convert Plan to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        """Convert Plan to JSON string.
+
+        The plan is embedded in agent prompts, so it is encoded without
+        indentation; the default separators keep fields reading as
+        "status": "FAILURE", as the prompts quote them.
+        """
+        return json.dumps(self.to_dict())
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Plan":
@@ -145,7 +154,16 @@ class Plan:
     @classmethod
     def from_response(cls, response: str) -> "Plan":
         """Create Plan from LLM response, handling various formats."""
-        # Try to extract JSON from markdown code blocks first
+        # Try to parse as direct JSON first, the format the agents ask for; only
+        # responses that look like a JSON object are worth handing to the parser
+        if response.lstrip()[:1] == "{":
+            try:
+                data = json.loads(response)
+                return cls._create_plan_from_data(data)
+            except json.JSONDecodeError:
+                pass
+
+        # Try to extract JSON from markdown code blocks
         if "```json" in response:
             start = response.find("```json") + 7
             end = response.find("```", start)
@@ -157,13 +175,6 @@ class Plan:
                 except json.JSONDecodeError:
                     pass
 
-        # Try to parse as direct JSON
-        try:
-            data = json.loads(response)
-            return cls._create_plan_from_data(data)
-        except json.JSONDecodeError:
-            pass
-
         # Fallback: return response as simple response plan
         return cls.create_simple_response(response)
 
@@ -2,7 +2,6 @@
 
 import asyncio
 import os
-import subprocess
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 import json
@@ -33,7 +32,9 @@ class BashToolResult(ToolResult):
 
     def get_summary(self) -> str:
         """Get a one-line summary of the command execution."""
-        lines_count = len(self.stdout.splitlines()) if self.stdout else 0
+        # Split the output once; the git summaries below reuse the lines
+        lines = self.stdout.splitlines() if self.stdout else []
+        lines_count = len(lines)
         if self.command and self.command.startswith('ls'):
             return f"Listed {lines_count} item(s)"
         elif self.command and (self.command.startswith('cat') or self.command.startswith('head')):
@@ -43,12 +44,19 @@ class BashToolResult(ToolResult):
         elif self.command and self.command.startswith('find'):
             return f"Found {lines_count} file(s)"
         elif self.command and self.command.startswith('git diff'):
-            lines = self.stdout.splitlines() if self.stdout else []
-            added = sum(1 for line in lines if line.startswith('+') and not line.startswith('+++'))
-            removed = sum(1 for line in lines if line.startswith('-') and not line.startswith('---'))
+            # One pass; the first character gates the file header checks
+            added = 0
+            removed = 0
+            for line in lines:
+                marker = line[:1]
+                if marker == '+':
+                    if not line.startswith('+++'):
+                        added += 1
+                elif marker == '-':
+                    if not line.startswith('---'):
+                        removed += 1
             return f"{added} addition(s), {removed} deletion(s)"
         elif self.command and self.command.startswith('git status'):
-            lines = self.stdout.splitlines() if self.stdout else []
             modified = sum(1 for line in lines if 'modified:' in line)
             new = sum(1 for line in lines if 'new file:' in line)
             return f"{modified} modified, {new} new file(s)"
@@ -187,8 +195,7 @@ class BashTool(Tool):
                 command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=working_dir,
-                shell=True
+                cwd=working_dir
             )
 
             try:
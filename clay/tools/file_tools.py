@@ -1,7 +1,9 @@
 """File manipulation tools for reading, writing, and updating files."""
 
 import os
+import re
 import difflib
+from itertools import islice
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,6 +12,10 @@ from .base import Tool, ToolResult, ToolError
 from ..trace import trace_operation
 
 
+# Start line of the old file in a unified diff hunk header: "@@ -start[,count] +..."
+_HUNK_HEADER_RE = re.compile(r'@@ -(\d+)')
+
+
 @dataclass
 class FileToolResult(ToolResult):
     """Specific result class for file tools."""
@@ -50,11 +56,9 @@ class FileToolResult(ToolResult):
             # For write operations, show the actual content
             if self.output:
                 # Format the content with line numbers for display
-                lines = self.output.splitlines()
-                formatted_lines = []
-                for i, line in enumerate(lines, 1):
-                    formatted_lines.append(f"{i:4d}→ {line}")
-                return '\n'.join(formatted_lines)
+                return '\n'.join(
+                    f"{i:4d}→ {line}" for i, line in enumerate(self.output.splitlines(), 1)
+                )
             else:
                 return f"Created {self.file_path} with {self.lines_affected} lines"
         elif self.operation == "update":
@@ -136,29 +140,31 @@ class ReadTool(Tool):
         encoding: str = "utf-8"
     ) -> FileToolResult:
         try:
-            if not os.path.exists(file_path):
-                raise ToolError(f"File not found: {file_path}")
+            # Opening the file doubles as the existence check
+            try:
+                f = open(file_path, 'r', encoding=encoding)
+            except FileNotFoundError:
+                raise ToolError(f"File not found: {file_path}") from None
+
+            # Apply line range if specified, reading no further than its end
+            with f:
+                # Size of the already opened file, without another path lookup
+                file_size = os.fstat(f.fileno()).st_size
+                if start_line is not None or end_line is not None:
+                    start_idx = (start_line - 1) if start_line else 0
+                    end_idx = end_line if end_line else None
+                    lines = list(islice(f, start_idx, end_idx))
+                else:
+                    lines = f.readlines()
 
-            with open(file_path, 'r', encoding=encoding) as f:
-                lines = f.readlines()
-
-            # Apply line range if specified
-            if start_line is not None or end_line is not None:
-                start_idx = (start_line - 1) if start_line else 0
-                end_idx = end_line if end_line else len(lines)
-                lines = lines[start_idx:end_idx]
-
-            content = ''.join(lines)
             lines_count = len(lines)
 
             # Format output with line numbers
-            output_lines = []
             base_line_num = start_line if start_line else 1
-            for i, line in enumerate(lines):
-                line_num = base_line_num + i
-                output_lines.append(f"{line_num:4d}→ {line.rstrip()}")
-
-            formatted_output = '\n'.join(output_lines)
+            formatted_output = '\n'.join(
+                f"{line_num:4d}→ {line.rstrip()}"
+                for line_num, line in enumerate(lines, base_line_num)
+            )
 
             return FileToolResult(
                 output=formatted_output,
@@ -168,7 +174,7 @@ class ReadTool(Tool):
                 metadata={
                     "encoding": encoding,
                     "total_lines": lines_count,
-                    "file_size": os.path.getsize(file_path)
+                    "file_size": file_size
                 }
             )
 
@@ -247,12 +253,13 @@ class WriteTool(Tool):
             if create_dirs and file_path_obj.parent != Path('.'):
                 file_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write the file
+            # Write the file; the final position is its size in bytes, which
+            # saves a separate stat of the file
             with open(file_path, 'w', encoding=encoding) as f:
                 f.write(content)
+                file_size = f.tell()
 
             lines_count = len(content.splitlines())
-            file_size = os.path.getsize(file_path)
 
             return FileToolResult(
                 output=content,  # Store the actual content
@@ -340,13 +347,39 @@ class UpdateTool(Tool):
             lineterm=""
         )
 
-        diff_lines = list(differ)
-        if len(diff_lines) <= 2:  # Only header lines, no actual changes
+        # difflib emits the two file header lines only when there are changes
+        if next(differ, None) is None:
             return "No changes detected"
+        next(differ, None)
 
-        # Count additions and deletions
-        additions = sum(1 for line in diff_lines if line.startswith('+') and not line.startswith('+++'))
-        deletions = sum(1 for line in diff_lines if line.startswith('-') and not line.startswith('---'))
+        # Walk the diff once as difflib produces it, numbering lines and counting
+        # changes in the same pass
+        output_lines = []
+        additions = 0
+        deletions = 0
+        current_line = 0
+
+        for line in differ:
+            # The first character tells the kind of every unified diff line;
+            # check them from the most to the least frequent
+            marker = line[:1]
+            if marker == ' ':
+                # Context line
+                output_lines.append(f"  {current_line:3d}                {line[1:]}")
+                current_line += 1
+            elif marker == '-':
+                # Deleted line
+                output_lines.append(f"  {current_line:3d} -              {line[1:]}")
+                current_line += 1
+                deletions += 1
+            elif marker == '+':
+                # Added line - use new line number
+                output_lines.append(f"  {current_line:3d} +              {line[1:]}")
+                # Don't increment current_line for additions
+                additions += 1
+            elif match := _HUNK_HEADER_RE.match(line):
+                # Hunk header: continue numbering from the hunk's start line
+                current_line = int(match.group(1))
 
         # Build summary line with the tool call format
         file_name = Path(file_path).name
@@ -359,42 +392,7 @@ class UpdateTool(Tool):
         else:
             summary = f"⏺ Update {file_name}"
 
-        output_lines = [summary]
-
-        # Process the diff to show context with line numbers
-        current_line = 0
-        in_hunk = False
-
-        for line in diff_lines:
-            if line.startswith('@@'):
-                # Parse hunk header to get line numbers
-                parts = line.split(' ')
-                if len(parts) >= 3:
-                    old_range = parts[1][1:]  # Remove the '-'
-                    if ',' in old_range:
-                        old_start = int(old_range.split(',')[0])
-                    else:
-                        old_start = int(old_range)
-                    current_line = old_start
-                in_hunk = True
-                continue
-
-            if not in_hunk:
-                continue
-
-            if line.startswith(' '):
-                # Context line
-                output_lines.append(f"  {current_line:3d}                {line[1:]}")
-                current_line += 1
-            elif line.startswith('-'):
-                # Deleted line
-                output_lines.append(f"  {current_line:3d} -              {line[1:]}")
-                current_line += 1
-            elif line.startswith('+'):
-                # Added line - use new line number
-                output_lines.append(f"  {current_line:3d} +              {line[1:]}")
-                # Don't increment current_line for additions
-
+        output_lines.insert(0, summary)
         return '\n'.join(output_lines)
 
     @trace_operation
@@ -407,26 +405,30 @@ class UpdateTool(Tool):
         replace_all: bool = False
     ) -> FileToolResult:
         try:
-            if not os.path.exists(file_path):
-                raise ToolError(f"File not found: {file_path}")
-
-            # Read the current file content
-            with open(file_path, 'r', encoding=encoding) as f:
-                original_content = f.read()
+            # Read the current file content; opening it doubles as the existence check
+            try:
+                with open(file_path, 'r', encoding=encoding) as f:
+                    original_content = f.read()
+            except FileNotFoundError:
+                raise ToolError(f"File not found: {file_path}") from None
+
+            # Locate the old content before building anything from the file
+            if replace_all:
+                replacements = original_content.count(old_content)
+            else:
+                replacements = 1 if old_content in original_content else 0
 
-            # Store original lines for diff
-            original_lines = original_content.splitlines(keepends=True)
+            if replacements == 0:
+                raise ToolError(f"Old content not found in {file_path}")
 
             # Perform the replacement
             if replace_all:
                 updated_content = original_content.replace(old_content, new_content)
-                replacements = original_content.count(old_content)
             else:
                 updated_content = original_content.replace(old_content, new_content, 1)
-                replacements = 1 if old_content in original_content else 0
 
-            if replacements == 0:
-                raise ToolError(f"Old content not found in {file_path}")
+            # Store original lines for diff
+            original_lines = original_content.splitlines(keepends=True)
 
             # Write the updated content
             with open(file_path, 'w', encoding=encoding) as f:
@@ -287,6 +287,9 @@ def trace_operation(func=None, **details):
     Can be used as @trace_operation or @trace_operation(extra="data")
     """
     def decorator(func):
+        # Last part of the module path, used as component for plain functions
+        module_component = func.__module__.rpartition('.')[2]
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Get caller information
@@ -301,28 +304,26 @@ def trace_operation(func=None, **details):
             }
 
             # Auto-detect component from module or class
-            component = func.__module__
             if (args and hasattr(args[0], '__class__') and
                 not isinstance(args[0], (str, int, float, bool, type(None), list, tuple, dict)) and
                 hasattr(args[0].__class__, '__name__')):
                 # If first argument is 'self' (an object instance), use class name as component
                 component = args[0].__class__.__name__
-            elif '.' in component:
-                # Use last part of module path
-                component = component.split('.')[-1]
+            else:
+                component = module_component
 
             operation = func.__name__
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             nested_call = _trace_collector.start_nested_call(component, operation, enhanced_details)
 
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _trace_collector.end_nested_call(nested_call, duration)
                 return result
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _trace_collector.end_nested_call(nested_call, duration, str(e), traceback.format_exc())
                 raise
 
@@ -340,28 +341,26 @@ def trace_operation(func=None, **details):
             }
 
             # Auto-detect component from module or class
-            component = func.__module__
             if (args and hasattr(args[0], '__class__') and
                 not isinstance(args[0], (str, int, float, bool, type(None), list, tuple, dict)) and
                 hasattr(args[0].__class__, '__name__')):
                 # If first argument is 'self' (an object instance), use class name as component
                 component = args[0].__class__.__name__
-            elif '.' in component:
-                # Use last part of module path
-                component = component.split('.')[-1]
+            else:
+                component = module_component
 
             operation = func.__name__
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             nested_call = _trace_collector.start_nested_call(component, operation, enhanced_details)
 
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _trace_collector.end_nested_call(nested_call, duration)
                 return result
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _trace_collector.end_nested_call(nested_call, duration, str(e), traceback.format_exc())
                 raise
 
@@ -393,7 +392,7 @@ def trace_method(component: str = None):
             elif not comp:
                 comp = func.__module__
 
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Get caller information
             caller_info = _get_caller_info(func)
@@ -416,13 +415,13 @@ def trace_method(component: str = None):
                 result = func(*args, **kwargs)
 
                 # Record success
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _trace_collector.end_nested_call(nested_call, duration)
                 return result
 
             except Exception as e:
                 # Record error
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _trace_collector.end_nested_call(nested_call, duration, str(e), traceback.format_exc())
                 raise
 
@@ -435,7 +434,7 @@ def trace_method(component: str = None):
             elif not comp:
                 comp = func.__module__
 
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Get caller information
             caller_info = _get_caller_info(func)
@@ -458,13 +457,13 @@ def trace_method(component: str = None):
                 result = await func(*args, **kwargs)
 
                 # Record success
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _trace_collector.end_nested_call(nested_call, duration)
                 return result
 
             except Exception as e:
                 # Record error
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _trace_collector.end_nested_call(nested_call, duration, str(e), traceback.format_exc())
                 raise
 
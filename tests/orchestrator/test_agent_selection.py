@@ -0,0 +1,60 @@
+"""Tests for LLM-based agent selection."""
+
+import pytest
+
+from clay.orchestrator import orchestrator as orchestrator_module
+from clay.orchestrator.orchestrator import ClayOrchestrator
+
+
+def make_completion(reply, calls):
+    """Create a fake completion function that records its messages."""
+    async def fake_completion(messages, **kwargs):
+        calls.append(messages)
+        return {"choices": [{"message": {"content": reply}}]}
+    return fake_completion
+
+
+class TestSelectAgent:
+    """Test agent routing."""
+
+    @pytest.mark.asyncio
+    async def test_routing_prompt_lists_agents(self, monkeypatch):
+        """Test that the routing prompt describes every agent and is reused across calls."""
+        calls = []
+        monkeypatch.setattr(orchestrator_module, "completion", make_completion("llm_agent", calls))
+        orchestrator = ClayOrchestrator(disable_llm=True)
+
+        assert await orchestrator.select_agent("explain recursion") == "llm_agent"
+        assert await orchestrator.select_agent("write a script") == "llm_agent"
+
+        first_system, second_system = calls[0][0]["content"], calls[1][0]["content"]
+        assert first_system is second_system
+        assert "- coding_agent: " in first_system
+        assert "- llm_agent: " in first_system
+        assert "Respond with ONLY the agent name from: llm_agent, coding_agent." in first_system
+        assert calls[1][1] == {"role": "user", "content": "Task: write a script"}
+
+    @pytest.mark.asyncio
+    async def test_reply_is_normalized(self, monkeypatch):
+        """Test that surrounding whitespace and case are ignored in the reply."""
+        monkeypatch.setattr(orchestrator_module, "completion", make_completion("  Coding_Agent\n", []))
+        orchestrator = ClayOrchestrator(disable_llm=True)
+
+        assert await orchestrator.select_agent("write a script") == "coding_agent"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("reply", ["coding_agent.", "`coding_agent`", "\"coding_agent\"", "'Coding_Agent',"])
+    async def test_reply_punctuation_is_ignored(self, monkeypatch, reply):
+        """Test that quotes and trailing punctuation around the agent name are ignored."""
+        monkeypatch.setattr(orchestrator_module, "completion", make_completion(reply, []))
+        orchestrator = ClayOrchestrator(disable_llm=True)
+
+        assert await orchestrator.select_agent("write a script") == "coding_agent"
+
+    @pytest.mark.asyncio
+    async def test_unknown_reply_falls_back_to_first_agent(self, monkeypatch):
+        """Test that an unrecognized reply selects the first registered agent."""
+        monkeypatch.setattr(orchestrator_module, "completion", make_completion("research_agent", []))
+        orchestrator = ClayOrchestrator(disable_llm=True)
+
+        assert await orchestrator.select_agent("find papers") == "llm_agent"
@@ -0,0 +1,408 @@
+"""Tests for orchestrator console display helpers."""
+
+import asyncio
+import io
+import sys
+
+import pytest
+
+from clay.orchestrator import orchestrator as orchestrator_module
+from clay.orchestrator.orchestrator import ClayOrchestrator, InteractiveConsole, ToolOutputBuffer
+from clay.orchestrator.plan import Plan, Step
+
+
+class RecordingStdout(io.StringIO):
+    """StringIO that records each individual write call."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return super().write(text)
+
+
+class TestInteractiveConsole:
+    """Test console display and line clearing."""
+
+    def test_ansi_support_is_checked_once(self, monkeypatch):
+        """Test that consoles reuse the ANSI support detected at import time."""
+        stdout = RecordingStdout()
+        monkeypatch.setattr(stdout, "isatty", lambda: not orchestrator_module._SUPPORTS_ANSI)
+        monkeypatch.setattr(sys, "stdout", stdout)
+
+        assert InteractiveConsole().supports_ansi is orchestrator_module._SUPPORTS_ANSI
+
+    def test_clear_and_redraw_is_a_single_write(self, monkeypatch):
+        """Test that clearing tracked lines and drawing new content is one write."""
+        stdout = RecordingStdout()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        console = InteractiveConsole()
+        console.supports_ansi = True
+
+        console.display("line 1\nline 2")
+        stdout.writes.clear()
+        console.display("line 3")
+
+        assert stdout.writes == ['\033[2F\033[J' + "line 3\n"]
+        assert console.tracked_lines == 1
+
+    def test_untracked_content_is_not_cleared(self, monkeypatch):
+        """Test that untracked content leaves the tracked line count untouched."""
+        stdout = RecordingStdout()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        console = InteractiveConsole()
+        console.supports_ansi = True
+
+        console.display("persistent", track_lines=False)
+
+        assert stdout.getvalue() == "persistent\n"
+        assert console.tracked_lines == 0
+
+    def test_append_extends_tracked_block(self, monkeypatch):
+        """Test that appended content is cleared together with the tracked block."""
+        stdout = RecordingStdout()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        console = InteractiveConsole()
+        console.supports_ansi = True
+
+        console.display("header\nline 1")
+        console.append("line 2\nline 3")
+        stdout.writes.clear()
+        console.display("")
+
+        assert stdout.writes == ['\033[4F\033[J']
+        assert console.tracked_lines == 0
+
+
+class TestPlanSummaryDisplay:
+    """Test plan summary rendering."""
+
+    def test_long_descriptions_are_truncated(self):
+        """Test that long step descriptions are shown as a single bounded line."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+        steps = [
+            Step("bash", {"command": "ls"}, "x" * 200),
+            Step("bash", {"command": "ls"}, "first line\nsecond line\nthird line"),
+            Step("bash", {"command": "ls"}, "single line\n"),
+        ]
+        plan = Plan(todo=steps, completed=[])
+
+        content = orchestrator._get_plan_summary_content(plan)
+
+        assert "x" * 78 not in content
+        assert "x" * 77 + "..." in content
+        assert "first line..." in content
+        assert "second line" not in content
+        assert "single line" in content and "single line..." not in content
+        # Separator, current task and two upcoming tasks
+        assert len(content.split('\n')) == 4
+
+    def test_missing_description(self):
+        """Test that steps without a description are rendered safely."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+        plan = Plan(todo=[Step("bash", {"command": "ls"})], completed=[])
+
+        content = orchestrator._get_plan_summary_content(plan)
+
+        assert "[1 remaining] Current: " in content
+
+    def test_summary_is_reused_until_plan_changes(self):
+        """Test that an unchanged todo list reuses the cached summary."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+        plan = Plan(todo=[Step("bash", {"command": "ls"}, "List"), Step("bash", {"command": "pwd"}, "Where")],
+                    completed=[])
+
+        first = orchestrator._get_plan_summary_content(plan)
+        assert orchestrator._get_plan_summary_content(plan) is first
+        assert "Waiting for next action" in orchestrator._get_plan_summary_content(plan, interactive=True)
+
+        plan.todo[1].description = "Print working directory"
+        assert "Print working directory" in orchestrator._get_plan_summary_content(plan)
+
+        plan.complete_next_step(result={"output": "ok"})
+        assert "[1 remaining]" in orchestrator._get_plan_summary_content(plan)
+
+
+class TestToolOutputBuffer:
+    """Test tool output buffering and summaries."""
+
+    def test_execution_time_is_frozen_after_finish(self):
+        """Test that execution time stops advancing once the tool finishes."""
+        buffer = ToolOutputBuffer("bash", {"command": "ls"})
+        buffer.finish(success=True)
+
+        elapsed = buffer.get_execution_time()
+
+        assert elapsed >= 0
+        assert buffer.get_execution_time() == elapsed
+
+    def test_only_last_lines_are_kept(self):
+        """Test that the buffer keeps a bounded tail while counting every line."""
+        buffer = ToolOutputBuffer("bash", {"command": "seq 100"})
+        for i in range(100):
+            buffer.add_output(f"{i}\n")
+
+        assert buffer.total_lines == 100
+        assert list(buffer.lines) == [str(i) for i in range(88, 100)]
+
+    def test_add_output_matches_splitlines(self):
+        """Test that single streamed lines and multi-line chunks are split consistently."""
+        chunks = ["plain line\n", "no newline", "a\nb\n", "tab\there\n", "cr\r\n", "x\r\ny", "\n"]
+        for chunk in chunks:
+            buffer = ToolOutputBuffer("bash", {"command": "echo"})
+            buffer.add_output(chunk)
+
+            assert list(buffer.lines) == chunk.splitlines()
+            assert buffer.total_lines == len(chunk.splitlines())
+
+    def test_reset_clears_previous_execution(self):
+        """Test that a reset buffer behaves like a freshly created one."""
+        buffer = ToolOutputBuffer("bash", {"command": "ls"})
+        buffer.add_output("a\nb\n")
+        buffer.mark_displayed()
+        buffer.display_name = "Bash(ls)"
+        buffer.finish(success=False)
+        lines = buffer.lines
+
+        buffer.reset("read", {"file_path": "x.py"})
+
+        assert buffer.tool_name == "read"
+        assert buffer.parameters == {"file_path": "x.py"}
+        assert buffer.display_name is None
+        assert list(buffer.lines) == []
+        assert buffer.total_lines == buffer.last_displayed_lines == 0
+        assert not buffer.is_finished
+        assert buffer.is_success is None
+        assert buffer.end_time is None
+        assert buffer.lines is lines
+
+    def test_real_time_summary_shows_last_lines(self):
+        """Test that the live summary shows the tail of the output and a hidden count."""
+        buffer = ToolOutputBuffer("bash", {"command": "seq 20"})
+        buffer.add_output("\n".join(str(i) for i in range(1, 21)))
+
+        summary, line_count = buffer.get_real_time_summary(use_colors=False)
+        lines = summary.split("\n")
+
+        assert lines[0].startswith("  ⎿ Running (20 lines, ")
+        assert lines[1] == "     9"
+        assert lines[12] == "     20"
+        assert lines[13] == "     ... (+8 earlier lines)"
+        assert line_count == len(lines) == 14
+
+    def test_real_time_summary_without_output(self):
+        """Test the live summary before any output has arrived."""
+        buffer = ToolOutputBuffer("bash", {"command": "sleep 1"})
+
+        summary, line_count = buffer.get_real_time_summary(use_colors=False)
+
+        assert summary.endswith("     (no output yet)")
+        assert line_count == 2
+
+    def test_snapshot_marks_output_displayed(self):
+        """Test that a snapshot returns the live summary and marks its output displayed."""
+        buffer = ToolOutputBuffer("bash", {"command": "seq 2"})
+        buffer.add_output("1\n2\n")
+
+        summary, line_count = buffer.snapshot(use_colors=False)
+
+        assert summary.split("\n")[1:] == ["     1", "     2"]
+        assert line_count == 3
+        assert buffer.last_displayed_lines == 2
+        assert not buffer.has_new_output()
+
+    def test_final_summary(self):
+        """Test the final summary for short, long and empty outputs."""
+        short = ToolOutputBuffer("bash", {"command": "echo"})
+        short.add_output("a\nb\n")
+        short.finish(success=True)
+        assert short.get_final_summary(use_colors=False).split("\n")[1:] == ["     a", "     b"]
+
+        long = ToolOutputBuffer("bash", {"command": "seq 15"})
+        long.add_output("\n".join(str(i) for i in range(1, 16)))
+        long.finish(success=False)
+        lines = long.get_final_summary(use_colors=False).split("\n")
+        assert lines[0].startswith("  ⎿ Failed (15 lines, ")
+        assert lines[1] == "     ... (+3 earlier lines)"
+        assert lines[2:] == [f"     {i}" for i in range(4, 16)]
+
+        empty = ToolOutputBuffer("bash", {"command": "true"})
+        empty.finish(success=True)
+        assert "(no output, " in empty.get_final_summary(use_colors=False)
+
+    def test_output_block_is_colored_once(self):
+        """Test that the gray color is emitted once per output block, not per line."""
+        buffer = ToolOutputBuffer("bash", {"command": "seq 3"})
+        buffer.add_output("1\n2\n3")
+
+        summary, line_count = buffer.get_real_time_summary(use_colors=True)
+        buffer.finish(success=True)
+        final = buffer.get_final_summary(use_colors=True)
+
+        assert line_count == 4
+        for text in (summary, final):
+            assert text.count("\033[37m") == 1
+            assert text.split("\n")[1] == "\033[37m     1"
+            assert text.endswith("     3\033[0m")
+
+    def test_incremental_output(self):
+        """Test that only lines added since the last summary are returned."""
+        buffer = ToolOutputBuffer("bash", {"command": "seq 5"})
+        assert buffer.get_incremental(0, use_colors=False) is None
+
+        buffer.add_output("1\n2\n")
+        buffer.mark_displayed()
+        assert buffer.get_incremental(buffer.last_displayed_lines, use_colors=False) is None
+
+        buffer.add_output("3\n4\n")
+        increment = buffer.get_incremental(buffer.last_displayed_lines, use_colors=False)
+        assert increment == "     3\n     4"
+        assert buffer.get_incremental(buffer.last_displayed_lines) == "\033[37m     3\n     4\033[0m"
+
+    def test_incremental_output_requires_full_redraw_past_window(self):
+        """Test that scrolling past the display window forces a full redraw."""
+        buffer = ToolOutputBuffer("bash", {"command": "seq 20"})
+        buffer.add_output("\n".join(str(i) for i in range(10)))
+        buffer.mark_displayed()
+        buffer.add_output("\n".join(str(i) for i in range(10)))
+
+        assert buffer.get_incremental(buffer.last_displayed_lines) is None
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change(self):
+        """Test that the monitor is woken by new output and by finishing."""
+        buffer = ToolOutputBuffer("bash", {"command": "echo"})
+
+        assert await buffer.wait_for_change(0.01) is False
+
+        buffer.add_output("line\n")
+        assert await buffer.wait_for_change(1.0) is True
+        assert await buffer.wait_for_change(0.01) is False
+
+        waiter = asyncio.ensure_future(buffer.wait_for_change(5.0))
+        await asyncio.sleep(0)
+        buffer.finish(success=True)
+        assert await asyncio.wait_for(waiter, 1.0) is True
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change_keeps_cancellation(self):
+        """Test that a cancel arriving together with a wake-up is not lost."""
+        buffer = ToolOutputBuffer("bash", {"command": "echo"})
+        waiter = asyncio.ensure_future(buffer.wait_for_change(5.0))
+        await asyncio.sleep(0)
+
+        buffer.finish(success=True)
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+
+class TestToolDisplayName:
+    """Test tool display name formatting."""
+
+    def test_known_tools(self):
+        """Test display names for tools with dedicated formatters."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+
+        assert orchestrator._get_tool_display_name("bash", {"command": "ls -la"}) == "Bash(ls -la)"
+        assert orchestrator._get_tool_display_name("write", {"file_path": "a.py"}) == "Write(a.py)"
+        assert orchestrator._get_tool_display_name("read", {"file_path": "b.py"}) == "Read(b.py)"
+
+    def test_long_bash_command_is_truncated(self):
+        """Test that long bash commands are shortened with an ellipsis."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+
+        display = orchestrator._get_tool_display_name("bash", {"command": "a" * 100})
+
+        assert display == f"Bash({'a' * 57}...)"
+
+    def test_unknown_tool_falls_back_to_title(self):
+        """Test the default display name for tools without a formatter."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+
+        assert orchestrator._get_tool_display_name("message", {}) == "Message(...)"
+
+
+class TestToolOutputMonitor:
+    """Test the persistent tool output monitor."""
+
+    @pytest.mark.asyncio
+    async def test_monitor_task_is_reused_across_tools(self):
+        """Test that one monitor task serves successive tool buffers."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+
+        first = ToolOutputBuffer("bash", {"command": "ls"})
+        orchestrator._start_monitor(first)
+        monitor_task = orchestrator._monitor_task
+        first.finish(success=True)
+
+        second = ToolOutputBuffer("bash", {"command": "pwd"})
+        orchestrator._start_monitor(second)
+        second.finish(success=True)
+
+        assert orchestrator._monitor_task is monitor_task
+        assert not monitor_task.done()
+
+        await orchestrator._stop_monitor()
+
+        assert monitor_task.cancelled()
+        assert orchestrator._monitor_task is None
+
+    @pytest.mark.asyncio
+    async def test_finished_buffers_are_pooled(self):
+        """Test that the monitor releases finished buffers for reuse."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+        buffer = ToolOutputBuffer("bash", {"command": "ls"})
+
+        orchestrator._start_monitor(buffer)
+        await asyncio.sleep(0)
+        buffer.add_output("file.txt\n")
+        buffer.finish(success=True)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert list(orchestrator._buffer_pool) == [buffer]
+        await orchestrator._stop_monitor()
+
+    @pytest.mark.asyncio
+    async def test_stop_monitor_without_task(self):
+        """Test that stopping an unstarted monitor is a no-op."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+
+        await orchestrator._stop_monitor()
+
+        assert orchestrator._monitor_task is None
+
+    def test_tool_output_header_is_cached_on_buffer(self):
+        """Test that the live tool header is formatted once per buffer."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+        orchestrator.console.supports_ansi = False
+        buffer = ToolOutputBuffer("bash", {"command": "make test"})
+
+        first = orchestrator._get_tool_output_content(buffer)
+        buffer.parameters = {"command": "changed"}
+        second = orchestrator._get_tool_output_content(buffer)
+
+        assert buffer.display_name == "Bash(make test)"
+        assert first.split("\n")[0] == second.split("\n")[0] == "⏺ Bash(make test)"
+
+    @pytest.mark.asyncio
+    async def test_no_monitor_without_ansi(self, monkeypatch):
+        """Test that tools run unmonitored when the terminal cannot redraw in place."""
+        orchestrator = ClayOrchestrator(disable_llm=True)
+        orchestrator.console.supports_ansi = False
+
+        async def review_plan(plan):
+            return plan
+        monkeypatch.setattr(orchestrator.agents["coding_agent"], "review_plan", review_plan)
+
+        plan = Plan(todo=[Step("bash", {"command": "echo hi"}, "Say hi")], completed=[])
+        plan = await orchestrator._execute_next_step(plan, "coding_agent", 0)
+        await orchestrator._wait_for_trace_files()
+
+        assert orchestrator._monitor_task is None
+        assert len(plan.completed) == 1
+        assert len(orchestrator._buffer_pool) == 1
@@ -1,7 +1,12 @@
 """Tests for plan serialization and KV-cache optimization."""
 
 import json
+import subprocess
+import sys
 from pathlib import Path
+
+import pytest
+
 from clay.orchestrator.plan import Plan, Step
 from clay.orchestrator.orchestrator import ClayOrchestrator
 
@@ -29,6 +34,50 @@ class TestPlanSerialization:
         assert len(plan_dict["completed"]) == 0
         assert len(plan_dict["todo"]) == 3
 
+    def test_plan_json_is_compact(self):
+        """Test that the prompt JSON has no indentation and round-trips."""
+        plan = Plan(todo=[Step("bash", {"command": "ls"}, "List files")], completed=[])
+        plan.complete_next_step(error="command failed")
+
+        plan_json = plan.to_json()
+
+        assert "\n" not in plan_json
+        assert '"status": "FAILURE"' in plan_json
+        assert Plan.from_json(plan_json) == plan
+
+    def test_plan_from_response_formats(self):
+        """Test parsing plain JSON, fenced JSON and prose responses."""
+        plan_data = {"todo": [{"tool_name": "bash", "parameters": {"command": "ls"}, "description": "List"}]}
+
+        direct = Plan.from_response("  " + json.dumps(plan_data))
+        fenced = Plan.from_response("Here you go:\n```json\n" + json.dumps(plan_data) + "\n```")
+        prose = Plan.from_response("Recursion is when a function calls itself.")
+        not_an_object = Plan.from_response("42")
+
+        assert direct.todo[0].parameters == {"command": "ls"}
+        assert fenced.todo[0].parameters == {"command": "ls"}
+        assert prose.todo[0].parameters["message"] == "Recursion is when a function calls itself."
+        assert not_an_object.todo[0].parameters["message"] == "42"
+
+    def test_plan_uses_slots(self):
+        """Test that plans keep a fixed attribute set and still behave as dataclasses."""
+        plan = Plan(todo=[Step("bash", {"command": "ls"}, "List files")], completed=[])
+
+        assert not hasattr(plan, "__dict__")
+        with pytest.raises(AttributeError):
+            plan.goal = "list files"
+        assert plan == Plan(todo=[Step("bash", {"command": "ls"}, "List files")], completed=[])
+
+    def test_package_import_defers_orchestrator(self):
+        """Test that importing Plan does not load the orchestrator module."""
+        code = (
+            "import sys; from clay.orchestrator import Plan; "
+            "assert 'clay.orchestrator.orchestrator' not in sys.modules; "
+            "from clay.orchestrator import ClayOrchestrator; "
+            "assert ClayOrchestrator.__module__ == 'clay.orchestrator.orchestrator'"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2])
+
     def test_plan_progression_maintains_prefix(self):
         """Test that as plans progress, they maintain stable prefixes for KV-cache optimization."""
         goal = "create test files"
@@ -137,7 +186,7 @@ class TestPlanSerialization:
             goal = "create and run hello world script"
 
             # Save plan using orchestrator method
-            filepath = orchestrator._save_plan_to_trace_dir(plan, 0)
+            filepath = orchestrator._write_plan_data(orchestrator._encode_plan(plan), 0)
 
             # Read and verify the saved plan structure
             with open(filepath, 'r') as f:
@@ -158,6 +207,87 @@ class TestPlanSerialization:
             print(f"  Plan keys order: {keys}")
             print(f"  Structure: Plan data directly serialized (no separate goal field)")
 
+    def test_orchestrator_plan_save_is_atomic(self, monkeypatch):
+        """Test that saved plans round-trip and leave no temporary files behind."""
+        from clay.orchestrator import orchestrator as orchestrator_module
+
+        orchestrator = ClayOrchestrator()
+        step = Step("write", {"file_path": "héllo.py", "content": "print('hi')"}, "Create file")
+        plan = Plan(todo=[step], completed=[])
+
+        # Exercise both the orjson path (when installed) and the stdlib fallback
+        for json_module in (orchestrator_module.orjson, None):
+            monkeypatch.setattr(orchestrator_module, "orjson", json_module)
+            filepath = orchestrator._write_plan_data(orchestrator._encode_plan(plan), 1)
+
+            with open(filepath, 'r', encoding='utf-8') as f:
+                assert json.load(f) == plan.to_dict()
+            assert not list(filepath.parent.glob("*.tmp"))
+
+    def test_plan_encoding_does_not_depend_on_orjson(self, monkeypatch):
+        """Test that orjson and the stdlib fallback write byte-identical plan files."""
+        from clay.orchestrator import orchestrator as orchestrator_module
+
+        orjson = pytest.importorskip("orjson")
+        step = Step("write", {"file_path": "héllo.py", "content": "print('hi')\n"}, "Create file")
+        plan = Plan(todo=[step], completed=[])
+
+        monkeypatch.setattr(orchestrator_module, "orjson", orjson)
+        with_orjson = ClayOrchestrator()._encode_plan(plan)
+        monkeypatch.setattr(orchestrator_module, "orjson", None)
+        without_orjson = ClayOrchestrator()._encode_plan(plan)
+
+        assert with_orjson == without_orjson
+
+    def test_orchestrator_encodes_completed_steps_once(self, monkeypatch):
+        """Test that plan saves only encode steps completed since the previous save."""
+        from clay.orchestrator import orchestrator as orchestrator_module
+
+        encoded = []
+        json_bytes = orchestrator_module._json_bytes
+
+        def counting_json_bytes(data):
+            encoded.append(data["description"])
+            return json_bytes(data)
+        monkeypatch.setattr(orchestrator_module, "_json_bytes", counting_json_bytes)
+
+        orchestrator = ClayOrchestrator()
+        steps = [Step("bash", {"command": f"echo {i}"}, f"Step {i}") for i in range(3)]
+        plan = Plan(todo=list(steps), completed=[])
+
+        for iteration in range(3):
+            plan.complete_next_step(result={"output": str(iteration)})
+            encoded.clear()
+            filepath = orchestrator._write_plan_data(orchestrator._encode_plan(plan), iteration)
+
+            # Only the newly completed step and the remaining todo steps are encoded
+            assert encoded == [f"Step {i}" for i in range(iteration, 3)]
+            with open(filepath, 'r', encoding='utf-8') as f:
+                assert json.load(f) == plan.to_dict()
+
+        # A different plan does not reuse the previous plan's completed steps
+        other = Plan(todo=[], completed=[Step("bash", {"command": "ls"}, "Other", status="SUCCESS")])
+        filepath = orchestrator._write_plan_data(orchestrator._encode_plan(other), 3)
+        with open(filepath, 'r', encoding='utf-8') as f:
+            assert json.load(f) == other.to_dict()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_saves_trace_files_in_background(self):
+        """Test that background saves snapshot the plan at the time they are requested."""
+        orchestrator = ClayOrchestrator()
+        step = Step("bash", {"command": "ls"}, "List files")
+        plan = Plan(todo=[step], completed=[])
+        expected = plan.to_dict()
+
+        await orchestrator._save_trace_files(plan, 3)
+        # Mutating the plan right away must not affect the saved snapshot
+        plan.complete_next_step(result={"output": "done"})
+        await orchestrator._wait_for_trace_files()
+
+        with open(orchestrator.traces_dir / "plan_iter_003.json", 'r', encoding='utf-8') as f:
+            assert json.load(f) == expected
+        assert (orchestrator.traces_dir / "clay_trace.json").exists()
+
     def test_prefix_optimization_with_realistic_scenario(self):
         """Test prefix optimization with a realistic multi-step coding scenario."""
         goal = "implement a calculator app in python"
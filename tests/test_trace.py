@@ -1,10 +1,12 @@
 """Comprehensive tests for the tracing system."""
 
 import asyncio
+import itertools
 import json
 import tempfile
 import threading
 import time
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
@@ -302,6 +304,21 @@ class TestTraceDecorators:
         assert call.duration > 0.01
         assert call.error is None
 
+    def test_duration_ignores_wall_clock_jumps(self):
+        clear_trace()
+
+        @trace_operation
+        def sync_func():
+            return 1
+
+        # Durations come from the monotonic clock, whatever the wall clock does
+        with patch("clay.trace.time.perf_counter", side_effect=itertools.count(100.0, 2.5)), \
+                patch("clay.trace.time.time", return_value=0.0):
+            sync_func()
+
+        call = get_trace_collector().get_nested_calls()[0]
+        assert call.duration == 2.5
+
     def test_trace_method(self):
         clear_trace()
 
@@ -409,6 +426,18 @@ class TestTraceSerialization:
             assert data["call_stack"][0]["component"] == "TestComp"
             assert data["call_stack"][0]["duration"] == 0.5
 
+    def test_trace_file_times_are_wall_clock(self):
+        clear_trace()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = save_trace_file("test_session", Path(temp_dir))
+            with open(filepath) as f:
+                data = json.load(f)
+
+        today = datetime.now().date()
+        assert datetime.fromisoformat(data["start_time_human"]).date() == today
+        assert data["start_time"] <= data["end_time"]
+
 
 class TestComplexScenarios:
     """Tests for complex tracing scenarios."""
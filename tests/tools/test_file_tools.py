@@ -66,6 +66,32 @@ class TestReadTool:
         assert "Line 2" not in result.output
         assert "Line 6" not in result.output
 
+    @pytest.mark.asyncio
+    async def test_read_file_with_open_ended_line_range(self, tmp_path):
+        """Test line ranges that omit one bound or run past the end of the file."""
+        test_file = tmp_path / "multiline.txt"
+        test_file.write_text("".join(f"Line {i}\n" for i in range(1, 11)))
+
+        read_tool = ReadTool()
+        tail = await read_tool.execute(file_path=str(test_file), start_line=9)
+        head = await read_tool.execute(file_path=str(test_file), end_line=2)
+        past_end = await read_tool.execute(file_path=str(test_file), start_line=10, end_line=50)
+
+        assert tail.output == "   9→ Line 9\n  10→ Line 10"
+        assert head.output == "   1→ Line 1\n   2→ Line 2"
+        assert past_end.lines_affected == 1
+
+    @pytest.mark.asyncio
+    async def test_read_reports_file_size(self, tmp_path):
+        """Test that the reported size is the whole file's, even for a line range."""
+        test_file = tmp_path / "sized.txt"
+        test_file.write_text("first\nsecond\n")
+
+        read_tool = ReadTool()
+        result = await read_tool.execute(file_path=str(test_file), end_line=1)
+
+        assert result.metadata["file_size"] == os.path.getsize(test_file) == 13
+
     @pytest.mark.asyncio
     async def test_read_file_encoding(self, tmp_path):
         """Test reading a file with different encoding."""
@@ -136,6 +162,18 @@ class TestWriteTool:
         assert test_file.parent.exists()
         assert test_file.read_text() == test_content
 
+    @pytest.mark.asyncio
+    async def test_write_reports_file_size_in_bytes(self, tmp_path):
+        """Test that the reported file size counts encoded bytes, not characters."""
+        test_file = tmp_path / "sized.txt"
+
+        write_tool = WriteTool()
+        result = await write_tool.execute(file_path=str(test_file), content="héllo\n你好\n")
+        empty = await write_tool.execute(file_path=str(tmp_path / "empty.txt"), content="")
+
+        assert result.metadata["file_size"] == os.path.getsize(test_file) == 14
+        assert empty.metadata["file_size"] == 0
+
     @pytest.mark.asyncio
     async def test_write_console_summary(self, tmp_path):
         """Test the console summary output for write operations."""
@@ -259,6 +297,56 @@ def subtract(a, b):
         # Check that the diff shows the added docstring
         assert '"""Subtract b from a."""' in test_file.read_text()
 
+    @pytest.mark.asyncio
+    async def test_update_diff_line_numbers(self, tmp_path):
+        """Test that the diff output numbers lines from the hunk's start in the file."""
+        test_file = tmp_path / "numbered.txt"
+        test_file.write_text("".join(f"line {i}\n" for i in range(1, 21)))
+
+        update_tool = UpdateTool()
+        result = await update_tool.execute(
+            file_path=str(test_file),
+            old_content="line 12\n",
+            new_content="line twelve\n"
+        )
+
+        output_lines = [line for line in result.output.split("\n") if line]
+        assert output_lines[0] == "⏺ Update numbered.txt with 1 additions and 1 deletions"
+        assert output_lines[1] == "    9                line 9"
+        assert "   12 -              line 12" in output_lines
+        assert "   13 +              line twelve" in output_lines
+        assert output_lines[-1] == "   15                line 15"
+
+    @pytest.mark.asyncio
+    async def test_update_diff_counts_lines_resembling_headers(self, tmp_path):
+        """Test that changed lines starting with '++' or '--' are counted as changes."""
+        test_file = tmp_path / "counter.c"
+        test_file.write_text("int i = 0;\n--i;\n")
+
+        update_tool = UpdateTool()
+        result = await update_tool.execute(
+            file_path=str(test_file),
+            old_content="--i;",
+            new_content="++i;"
+        )
+
+        assert result.output.startswith("⏺ Update counter.c with 1 additions and 1 deletions")
+
+    @pytest.mark.asyncio
+    async def test_update_without_changes(self, tmp_path):
+        """Test the diff output when the replacement equals the old content."""
+        test_file = tmp_path / "same.txt"
+        test_file.write_text("unchanged\n")
+
+        update_tool = UpdateTool()
+        result = await update_tool.execute(
+            file_path=str(test_file),
+            old_content="unchanged",
+            new_content="unchanged"
+        )
+
+        assert result.output == "No changes detected"
+
     @pytest.mark.asyncio
     async def test_update_preserves_whitespace(self, tmp_path):
         """Test that update preserves exact whitespace."""
@@ -340,6 +428,13 @@ class TestFileToolResult:
         assert result_dict["metadata"]["encoding"] == "utf-8"
 
 
+    def test_write_formatted_output_numbers_lines(self):
+        """Test that written content is displayed with line numbers."""
+        result = FileToolResult(output="a\nb", file_path="f.txt", lines_affected=2, operation="write")
+
+        assert result.get_formatted_output() == "   1→ a\n   2→ b"
+
+
 class TestToolIntegration:
     """Integration tests for file tools working together."""
 